@@ -6,20 +6,39 @@ from a Python application. It shows both basic usage and advanced patterns.
 """
 
 import asyncio
-import json
 from typing import Dict
 from typing import List
 
 import httpx
+import orjson
+import ormsgpack
 
 
 class MarkdownMCPClient:
-    """Client for interacting with the Markdown MCP server."""
+    """Client for interacting with the Markdown MCP server.
 
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    Holds a single connection pool for all requests. Use it as an async context
+    manager, or call `aclose` when done, to release the connections.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8080", timeout: float = 30.0):
         """Initialize the client with the server URL."""
         self.base_url = base_url
         self.mcp_url = f"{base_url}/server/mcp/"
+        self.split_url = f"{base_url}/split"
+        self._client = httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_keepalive_connections=20)
+        )
+
+    async def __aenter__(self) -> "MarkdownMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
 
     async def split_text(self, text: str) -> List[Dict]:
         """Split markdown text using the MCP server."""
@@ -30,39 +49,60 @@ class MarkdownMCPClient:
             "params": {"name": "split_text", "arguments": {"text": text}},
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.mcp_url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream",
-                },
-            )
+        # Stream the response body into a single buffer instead of decoding it to str
+        buffer = bytearray()
+        async with self._client.stream(
+            "POST",
+            self.mcp_url,
+            content=orjson.dumps(payload),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream",
+            },
+        ) as response:
             response.raise_for_status()
-
-            # Parse SSE response
-            response_text = response.text.strip()
-            if response_text.startswith("event: message") and "data: " in response_text:
-                # Extract data part from SSE format
-                data_start = response_text.find("data: ") + len("data: ")
-                data_part = response_text[data_start:]
-                result = json.loads(data_part)
-                # Extract the actual result from MCP response
-                sections_data = result["result"]["content"][0]["text"]
-                # Parse the JSON string containing the sections
-                sections = json.loads(sections_data)
-                # Convert single section dict to list, or return list as-is
-                return sections if isinstance(sections, list) else [sections]
-            elif response_text:
-                # Try parsing as regular JSON
-                result = json.loads(response_text)
-                return result["result"] if "result" in result else result
-            else:
-                raise ValueError("Empty response from server")
-
-
-async def example_basic_usage():
+            is_event_stream = response.headers.get("content-type", "").startswith(
+                "text/event-stream"
+            )
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+
+        if not buffer.strip():
+            raise ValueError("Empty response from server")
+
+        # Parse SSE response; plain JSON bodies may contain "data: " inside strings
+        data_start = -1
+        if is_event_stream or buffer.startswith(b"event:"):
+            data_start = buffer.find(b"data: ")
+        if data_start != -1:
+            # Extract data part from SSE format without copying the buffer
+            data_start += len(b"data: ")
+            data_end = buffer.find(b"\n", data_start)
+            if data_end == -1:
+                data_end = len(buffer)
+            result = orjson.loads(memoryview(buffer)[data_start:data_end])
+            # The server returns the sections as a JSON array in the text content
+            return orjson.loads(result["result"]["content"][0]["text"])
+
+        # Try parsing as regular JSON
+        result = orjson.loads(buffer)
+        return result["result"] if "result" in result else result
+
+    async def split_text_msgpack(self, text: str) -> List[Dict]:
+        """Split markdown text using the HTTP endpoint with a MessagePack response."""
+        response = await self._client.post(
+            self.split_url,
+            content=orjson.dumps({"text": text}),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/msgpack",
+            },
+        )
+        response.raise_for_status()
+        return ormsgpack.unpackb(response.content)
+
+
+async def example_basic_usage(client: MarkdownMCPClient):
     """Demonstrate basic usage of the MCP client."""
     print("=== Basic Usage Example ===")
 
@@ -93,8 +133,6 @@ Learn how to integrate with the API.
 Build your own processors.
 """
 
-    client = MarkdownMCPClient()
-
     try:
         sections = await client.split_text(markdown_text)
 
@@ -113,7 +151,7 @@ Build your own processors.
         print(f"Error: {e}")
 
 
-async def example_document_analysis():
+async def example_document_analysis(client: MarkdownMCPClient):
     """Demonstrate document analysis patterns."""
     print("=== Document Analysis Example ===")
 
@@ -153,8 +191,6 @@ List all projects.
 API rate limits apply.
 """
 
-    client = MarkdownMCPClient()
-
     try:
         sections = await client.split_text(markdown_text)
 
@@ -197,15 +233,45 @@ API rate limits apply.
         print(f"Error: {e}")
 
 
+async def example_msgpack_usage(client: MarkdownMCPClient):
+    """Demonstrate fetching sections as MessagePack over plain HTTP."""
+    print("=== MessagePack Example ===")
+
+    markdown_text = """
+# Release Notes
+
+## Added
+- MessagePack responses
+
+## Fixed
+- Code blocks are kept verbatim
+"""
+
+    try:
+        sections = await client.split_text_msgpack(markdown_text)
+
+        print(f"Received {len(sections)} sections as MessagePack:")
+        for section in sections:
+            indent = "  " * (section["header_level"] - 1)
+            print(f"{indent}- {section['section_header']}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
 async def main():
     """Run all examples."""
     print("Markdown MCP Server - Python Client Examples")
     print("=" * 50)
     print()
 
-    await example_basic_usage()
-    print()
-    await example_document_analysis()
+    # Share one client so every example reuses the same connections
+    async with MarkdownMCPClient() as client:
+        await example_basic_usage(client)
+        print()
+        await example_document_analysis(client)
+        print()
+        await example_msgpack_usage(client)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,42 @@
+import asyncio
+import os
 from functools import lru_cache
+from typing import Annotated
+from typing import Any
+from typing import Iterable
+from typing import Iterator
 
+import orjson
+import ormsgpack
 import uvicorn
+from fastapi import Depends
 from fastapi import FastAPI
+from fastapi import Header
+from fastapi import Request
+from fastapi import Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import StreamingResponse
 from fastmcp import FastMCP
+from pydantic import BaseModel
 
 from models import Section
+from models import SectionRecord
+from models import SplitTextRequest
 from settings import get_logger
 from splitter import MarkdownSplitter
 
 logger = get_logger("MarkdownMCPServer")
 
+# Documents with at least this many characters are streamed by the /split endpoint
+STREAMING_THRESHOLD = int(os.getenv("STREAMING_THRESHOLD", "65536"))
+# Number of distinct documents below STREAMING_THRESHOLD whose sections are kept in memory
+SPLIT_CACHE_SIZE = int(os.getenv("SPLIT_CACHE_SIZE", "256"))
+# Streamed /split responses are sent in chunks of at least this many bytes
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "65536"))
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+TEXT_MEDIA_TYPES = ("text/markdown", "text/plain")
+
 
 @lru_cache
 def _splitter() -> MarkdownSplitter:
@@ -24,26 +51,117 @@ def _splitter() -> MarkdownSplitter:
     return MarkdownSplitter()
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Encode objects that orjson does not serialize natively.
+
+    orjson handles str, int, float, bool, None, dict, list, tuple, datetime, UUID and
+    dataclasses (including the `SectionRecord` objects returned by the splitter) on its
+    own. Pydantic models are dumped to plain Python objects, which orjson then encodes
+    without going through `jsonable_encoder`.
+
+    Args:
+        obj: The object orjson was unable to serialize.
+
+    Returns:
+        A representation of the object that orjson can serialize.
+
+    Raises:
+        TypeError: If the object type is not supported.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes using orjson.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        The JSON encoded data.
+    """
+    return orjson.dumps(data, default=_orjson_default)
+
+
+def _serialize(data: Any) -> str:
+    """Serialize MCP tool results to a JSON string using orjson.
+
+    Args:
+        data: The tool result to serialize.
+
+    Returns:
+        The JSON encoded result.
+    """
+    return _dumps(data).decode()
+
+
+def _stream_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items as a JSON array in chunks of about STREAM_CHUNK_SIZE bytes.
+
+    Starlette iterates synchronous generators in a threadpool, one hop per chunk, so
+    encoded items are buffered rather than yielded one at a time.
+
+    Args:
+        items: The items to encode. Consumed lazily.
+
+    Yields:
+        Consecutive chunks of the JSON array. The last chunk ends with the closing
+        bracket.
+    """
+    buffer = bytearray(b"[")
+    for i, item in enumerate(items):
+        if i:
+            buffer += b","
+        buffer += _dumps(item)
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
 # Initialize FastMCP server with stateless HTTP support
 # This enables the server to handle HTTP requests without maintaining session state
-mcp = FastMCP("MarkdownMCPServer", stateless_http=True)
+# Tool results are serialized with orjson instead of the default pydantic serializer
+mcp = FastMCP("MarkdownMCPServer", stateless_http=True, tool_serializer=_serialize)
 markdown_splitter = _splitter()
 
 
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _split_cached(text: str) -> tuple[SectionRecord, ...]:
+    """Split Markdown text into sections, reusing the result for repeated inputs.
+
+    Splitting is a pure function of the text, so identical documents are only parsed
+    once. Python caches the hash of each str, so lookups do not rescan the text unless
+    a candidate entry has to be compared for equality.
+
+    Args:
+        text: The Markdown text to split.
+
+    Returns:
+        The sections as a tuple of frozen records, shared between callers. The
+        `parents` dict of each record's metadata must not be modified.
+    """
+    return tuple(markdown_splitter.split_text(text=text))
+
+
 @mcp.tool
-def split_text(text: str) -> list[Section]:
+async def split_text(text: str) -> str:
     """Split Markdown text into hierarchical sections.
 
     This MCP tool processes Markdown documents and returns a list of sections
     with preserved hierarchy, sibling relationships, and metadata. Each section
     includes the header text, content, level, and relationship information.
+    Splitting runs in a worker thread so large documents do not block the event loop.
 
     Args:
         text: The Markdown text to process. Should contain headers marked with
               '#' symbols (e.g., "# Header 1", "## Header 2").
 
     Returns:
-        A list of Section objects containing:
+        A JSON array of Section objects containing:
         - section_header: The header text without '#' markers
         - section_text: The content between this header and the next
         - header_level: The level of the header (1 for H1, 2 for H2, etc.)
@@ -51,16 +169,22 @@ def split_text(text: str) -> list[Section]:
 
     Example:
         Input: "# Main\\nContent here\\n## Sub\\nSub content"
-        Returns: [
-            Section(section_header="Main", header_level=1, ...),
-            Section(section_header="Sub", header_level=2, ...)
-        ]
+        Returns: '[{"section_header": "Main", "header_level": 1, ...},
+                   {"section_header": "Sub", "header_level": 2, ...}]'
     """
-    logger.info(f"Processing split_text request with {len(text)} characters")
+    logger.debug("Processing split_text request with %d characters", len(text))
+    if "#" not in text:
+        # Text without a '#' has no headers, so answer without a worker thread
+        return "[]"
     try:
-        sections = markdown_splitter.split_text(text=text)
-        logger.info(f"Successfully processed request, returning {len(sections)} sections")
-        return sections
+        # Large documents bypass the cache so they cannot pin unbounded memory
+        if len(text) < STREAMING_THRESHOLD:
+            sections = await asyncio.to_thread(_split_cached, text)
+        else:
+            sections = await asyncio.to_thread(markdown_splitter.split_text, text)
+        logger.debug("Successfully processed request, returning %d sections", len(sections))
+        # Serialize here so a single section is still returned as a JSON array
+        return _serialize(sections)
 
     except Exception as e:
         logger.error(f"Error processing split_text request: {e}", exc_info=True)
@@ -78,6 +202,7 @@ app = FastAPI(
     description="A Model Context Protocol server for splitting Markdown documents",
     version="0.1.0",
     lifespan=asgi_app.lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Mount the MCP server at /server path
@@ -85,9 +210,117 @@ app = FastAPI(
 app.mount("/server", asgi_app)
 
 
+async def _read_text(request: Request) -> str:
+    """Extract the Markdown text from the body of a /split request.
+
+    `text/markdown` and `text/plain` bodies are used as-is. Otherwise the body is decoded
+    with orjson and only its `text` field is read, which skips building and validating a
+    request model for the whole payload.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The Markdown text to split.
+
+    Raises:
+        RequestValidationError: If the body is not valid UTF-8, not valid JSON, or has no
+            string `text` field.
+    """
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith(TEXT_MEDIA_TYPES):
+            return body.decode()
+        text = orjson.loads(body)["text"]
+    except (UnicodeDecodeError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        ) from e
+
+    if not isinstance(text, str):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "string_type",
+                    "loc": ("body", "text"),
+                    "msg": "Input should be a valid string",
+                    "input": text,
+                }
+            ]
+        )
+    return text
+
+
+@app.post(
+    "/split",
+    # The route returns pre-encoded bytes, so the model only documents the response and
+    # FastAPI never validates or re-encodes the sections
+    responses={200: {"model": list[Section], "content": {MSGPACK_MEDIA_TYPE: {}}}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": SplitTextRequest.model_json_schema()},
+                **{media_type: {"schema": {"type": "string"}} for media_type in TEXT_MEDIA_TYPES},
+            },
+        }
+    },
+)
+def split(
+    text: Annotated[str, Depends(_read_text)],
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Split Markdown text into hierarchical sections over plain HTTP.
+
+    Small documents are serialized in one pass. Documents of at least
+    `STREAMING_THRESHOLD` characters are streamed as a JSON array, one section at
+    a time, so the first bytes are sent before all sections are serialized.
+
+    Clients that send `Accept: application/msgpack` receive the sections encoded as
+    MessagePack instead. MessagePack arrays are prefixed with their length, so these
+    responses are never streamed.
+
+    The body is either a JSON object with a `text` field or the raw Markdown sent as
+    `text/markdown` or `text/plain`.
+
+    Args:
+        text: The Markdown text extracted from the request body.
+        accept: The Accept header of the request.
+
+    Returns:
+        A JSON or MessagePack array of Section objects.
+    """
+    logger.debug("Processing split request with %d characters", len(text))
+    use_msgpack = MSGPACK_MEDIA_TYPE in (accept or "")
+
+    if len(text) < STREAMING_THRESHOLD:
+        sections = _split_cached(text)
+    elif use_msgpack:
+        sections = markdown_splitter.split_text(text=text)
+    else:
+        sections = markdown_splitter.split_text_iter(text=text)
+        return StreamingResponse(_stream_json_array(sections), media_type="application/json")
+
+    if use_msgpack:
+        content = ormsgpack.packb(sections, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+        return Response(content=content, media_type=MSGPACK_MEDIA_TYPE)
+    return Response(content=_dumps(sections), media_type="application/json")
+
+
 if __name__ == "__main__":
     # Start the server with uvicorn
     # Binds to all interfaces (0.0.0.0) on port 8080 for development
+    workers = int(os.getenv("WORKERS", "1"))
     logger.info("Starting Markdown MCP Server on http://0.0.0.0:8080")
     logger.info("MCP endpoints available at /server/mcp/")
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        # Multiple workers require an import string so each process can load the app
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8080,
+        # Use the uvloop event loop where available and the httptools HTTP parser
+        loop="auto",
+        http="httptools",
+        workers=workers,
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true",
+    )
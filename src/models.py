@@ -1,8 +1,8 @@
-import re
+from dataclasses import dataclass
+from dataclasses import field
 
 from pydantic import BaseModel
 from pydantic import Field
-from pydantic import field_validator
 
 
 class MarkdownContent(BaseModel):
@@ -11,11 +11,6 @@ class MarkdownContent(BaseModel):
     section_header: str = Field(..., description="The Markdown section header")
     section_text: str = Field(..., description="The Markdown section content")
 
-    @field_validator("section_header")
-    def clean_section_header(cls, value):
-        """Remove leading and trailing whitespace from the section header."""
-        return re.sub(r"^#+\s*", "", value)
-
 
 class SectionMetadata(BaseModel):
     """Metadata fields for a Markdown section."""
@@ -51,3 +46,42 @@ class Section(MarkdownContent):
     def to_markdown(self) -> str:
         """Convert the section to a Markdown string."""
         return f"{'#' * self.header_level} {self.section_header}\n\n{self.section_text}"
+
+
+@dataclass(slots=True, frozen=True)
+class SectionMetadataRecord:
+    """Unvalidated counterpart of `SectionMetadata` produced by the splitter."""
+
+    token_count: int | None = None
+    model_version: str | None = None
+    normalized: bool = False
+    error: str | None = None
+    original_content: MarkdownContent | None = None
+    parents: dict[str, str | None] = field(default_factory=dict)
+    siblings: tuple[str, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class SectionRecord:
+    """Unvalidated counterpart of `Section` produced by the splitter.
+
+    Has the same fields as `Section`, but skips Pydantic validation on construction and
+    is serialized natively by orjson. Records are frozen because cached results are shared
+    between requests; use `dataclasses.replace` to derive an updated copy, or
+    `Section.model_validate(record, from_attributes=True)` to obtain a validated model.
+    """
+
+    section_header: str
+    section_text: str
+    header_level: int
+    metadata: SectionMetadataRecord = field(default_factory=SectionMetadataRecord)
+
+    def to_markdown(self) -> str:
+        """Convert the section to a Markdown string."""
+        return f"{'#' * self.header_level} {self.section_header}\n\n{self.section_text}"
+
+
+class SplitTextRequest(BaseModel):
+    """Request body for splitting a Markdown document over HTTP."""
+
+    text: str = Field(..., description="The Markdown text to split")
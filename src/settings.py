@@ -4,6 +4,7 @@ This module centralizes logging configuration and can be extended
 for other application-wide functionality.
 """
 
+import atexit
 import logging
 import logging.config
 import os
@@ -40,8 +41,10 @@ def setup_logging(config_path: Optional[str] = None) -> None:
     logs_dir.mkdir(exist_ok=True)
 
     try:
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=loader)
 
         # Allow environment variable override for log levels
         log_level = os.getenv("LOG_LEVEL", "").upper()
@@ -53,6 +56,7 @@ def setup_logging(config_path: Optional[str] = None) -> None:
                 config["root"]["level"] = log_level
 
         logging.config.dictConfig(config)
+        _start_queue_listeners(config)
         logging.getLogger(__name__).info("Logging configuration loaded successfully.")
 
     except Exception as e:
@@ -65,6 +69,23 @@ def setup_logging(config_path: Optional[str] = None) -> None:
         )
 
 
+def _start_queue_listeners(config: dict) -> None:
+    """Start the listeners created by dictConfig for queue handlers.
+
+    dictConfig builds a QueueListener for each QueueHandler but does not start it. The
+    listener is stopped at exit so queued records are flushed.
+
+    Args:
+        config: The logging configuration passed to dictConfig.
+    """
+    for handler_name in config.get("handlers", {}):
+        handler = logging.getHandlerByName(handler_name)
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            listener.start()
+            atexit.register(listener.stop)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the specified name.
 
@@ -1,34 +1,95 @@
 import logging
-import os
 import re
+from array import array
 from pathlib import Path
 from typing import Dict
+from typing import Iterator
 from typing import List
-from typing import Optional
+from typing import Tuple
 from typing import Union
 
-from models import Section
-from models import SectionMetadata
+from models import SectionMetadataRecord
+from models import SectionRecord
 
 logger = logging.getLogger("MarkdownSplitter")
 
+MAX_HEADER_LEVEL = 6
+
+# Lines that open a header (group 1 holds the '#' markers) or a code fence (group 2 holds
+# the indentation). Candidates are matched from the preceding newline, which lets the
+# regex engine skip ahead with a literal search instead of trying every position as a
+# MULTILINE anchor would.
+_CANDIDATE = r"(?:(#{1,%d})[ \t]|( {0,3})(?:```|~~~))" % MAX_HEADER_LEVEL
+CANDIDATE_LINE_PATTERN = re.compile(r"\n" + _CANDIDATE)
+FIRST_LINE_PATTERN = re.compile(_CANDIDATE)
+
+
+def _candidate_lines(text: str) -> Iterator[re.Match]:
+    """Yield a match for each line that may be a header or a code fence."""
+    match = FIRST_LINE_PATTERN.match(text)
+    if match is not None:
+        yield match
+    yield from CANDIDATE_LINE_PATTERN.finditer(text)
+
+
+def _scan(text: str) -> List[Tuple[int, int, int, str]]:
+    """Locate the ATX headers in a Markdown document.
+
+    Only lines that can open a code fence or a header are visited: `_candidate_lines`
+    finds and classifies them inside the regex engine, so ordinary lines never reach
+    Python code. Lines inside fenced code blocks (``` or ~~~, indented by up to three
+    spaces) are skipped. A header starts with one to six '#' characters followed by a
+    space or a tab, and must contain some text.
+
+    Args:
+        text (str): The Markdown text to scan.
+
+    Returns:
+        List[Tuple[int, int, int, str]]: A (line_start, line_length, level, header) tuple
+            for each header, in document order. The header has its markers and
+            surrounding whitespace removed.
+    """
+    headers = []
+    fence = None
+
+    for match in _candidate_lines(text):
+        marks_start, marks_end = match.span(1)
+        end = text.find("\n", match.end())
+        if end == -1:
+            end = len(text)
+
+        if marks_start == -1:
+            # Only a matching marker closes the code block
+            char = text[match.end(2)]
+            if fence is None:
+                fence = char
+            elif char == fence:
+                fence = None
+
+        elif fence is None:
+            header = text[marks_end:end].strip()
+            if header:
+                headers.append((marks_start, end - marks_start, marks_end - marks_start, header))
+
+    return headers
+
 
 class MarkdownSplitter:
     """Split Markdown documents into sections based on header hierarchy.
 
     Processes Markdown documents and splits them into sections based on
-    header levels (# through #####). It maintains the hierarchical relationships between
+    header levels (# through ######). It maintains the hierarchical relationships between
     sections and tracks sibling headers at the same level. Valid Markdown headers should
-    start with \'#\' followed by a space (e.g., "# Header 1", "## Header 2").
-    The expresssion used to match headers is: `^(#+)\\s+(.+)$`. If the header pattern in
-    your text is different, you may need to adjust the `_header_pattern` attribute.
+    start with one to six \'#\' followed by a space (e.g., "# Header 1", "## Header 2").
+    Candidate lines are located and classified by a regular expression: one group
+    captures the header markers and another the indentation of a code fence.
 
     Key Features:
         - Splits Markdown text into sections based on headers
         - Maintains parent-child relationships between headers
         - Tracks sibling headers at the same level
         - Handles code blocks correctly (ignores # in code)
-        - Supports headers up to level 5 (##### H5)
+        - Supports headers up to level 6 (###### H6)
 
     Example:
         >>> splitter = MarkdownSplitter()
@@ -64,35 +125,28 @@ class MarkdownSplitter:
         Siblings: ['Installation']
     """
 
-    def __init__(self):
-        self._header_pattern = re.compile(r"^(#+)\s+(.+)$", re.MULTILINE)
+    def _scan_headers(self, text: str) -> List[Tuple[int, str, str]]:
+        """Find the headers in a Markdown document together with their content.
 
-    def _process_code_blocks(self, text: str) -> tuple[str, dict[str, str]]:
-        """Process code blocks to protect comments from being treated as headers."""
-        replacement_map = {}
-        counter = 0
+        Uses the offsets returned by `_scan` to slice each header and its content out of
+        the original text. Text before the first header is ignored.
 
-        def replace_comments(match):
-            nonlocal counter
-            code_block = match.group(1)
-            lines = code_block.split("\n")
-            processed_lines = []
+        Args:
+            text (str): The Markdown text to scan.
 
-            for line in lines:
-                if line.lstrip().startswith("#"):
-                    token = f"{{{{CODE_COMMENT_{counter}}}}}"
-                    replacement_map[token] = line
-                    counter += 1
-                    processed_lines.append(token)
-                else:
-                    processed_lines.append(line)
+        Returns:
+            List[Tuple[int, str, str]]: A (level, header, content) tuple for each header,
+                in document order.
+        """
+        offsets = _scan(text)
+        headers = []
 
-            return f"```{os.linesep.join(processed_lines)}```"
+        for i, (line_start, line_length, level, header) in enumerate(offsets):
+            content_end = offsets[i + 1][0] if i + 1 < len(offsets) else len(text)
+            content = text[line_start + line_length + 1 : content_end].strip()
+            headers.append((level, header, content))
 
-        processed_text = re.sub(
-            r"```(?:.*?)\n(.*?)```", replace_comments, text, flags=re.DOTALL
-        )
-        return processed_text, replacement_map
+        return headers
 
     @classmethod
     def get_document_outline(cls, text: str) -> Dict:
@@ -158,9 +212,7 @@ class MarkdownSplitter:
             logger.warning("`get_document_outline` received empty text input.")
             return {}
 
-        splitter = cls()
-        processed_text, _ = splitter._process_code_blocks(text)
-        headers = list(splitter._header_pattern.finditer(processed_text))
+        headers = cls()._scan_headers(text)
 
         if not headers:
             return {}
@@ -173,15 +225,7 @@ class MarkdownSplitter:
         # First pass: Build basic structure and collect siblings
         sibling_groups = {}  # Will store headers at same level with same immediate parent
 
-        for i, match in enumerate(headers):
-            header_marks, header_text = match.group(1), match.group(2).strip()
-            current_level = len(header_marks)
-
-            # Extract content
-            start_pos = match.end()
-            end_pos = headers[i + 1].start() if i + 1 < len(headers) else len(processed_text)
-            content = processed_text[start_pos:end_pos].strip()
-
+        for current_level, header_text, content in headers:
             # Create node
             current_node = {
                 "content": content,
@@ -232,67 +276,7 @@ class MarkdownSplitter:
 
         return document_outline
 
-    def _create_sections_from_outline(
-        self, outline: Dict, parent_headers: Dict[str, Optional[str]] = None
-    ) -> List[Section]:
-        """Convert a document outline into a flat list of Section objects with hierarchy information.
-
-        Traverses the hierarchical document outline and creates Section objects and maintain
-        the parent-child relationships and sibling connections. Recursively processes the outline
-        to handle nested headers of any depth
-
-        Args:
-            outline (Dict): A nested dictionary representing the document structure. Each node should contain:
-                - content (str): The text content under the header
-                - level (int): The header level (1 for H1, 2 for H2, etc.)
-                - children (Dict): Nested headers under this header
-                - siblings (List[str]): Headers at the same level with the same parent
-            parent_headers (Dict[str, Optional[str]], optional): A dictionary mapping header levels
-                to their parent header text. Keys are in the format 'h1', 'h2', etc. Defaults to None,
-                which initializes an empty parent hierarchy.
-
-        Returns:
-            List[Section]: A flat list of Section objects, each containing:
-                - section_header (str): The header text
-                - section_text (str): The content under the header
-                - header_level (int): The level of the header
-                - metadata (SectionMetadata): Contains parent headers and sibling information
-        """
-        if parent_headers is None:
-            parent_headers = {f"h{i}": None for i in range(1, 5)}
-
-        sections = []
-
-        for header, node in outline.items():
-            level = node["level"]
-            content = node["content"]
-
-            # Create metadata with parents and siblings
-            metadata = SectionMetadata(
-                parents={k: v for k, v in parent_headers.items() if v is not None},
-                siblings=node["siblings"],
-            )
-
-            # Create section
-            section = Section(
-                section_header=header,
-                section_text=content,
-                header_level=level,
-                metadata=metadata,
-            )
-            sections.append(section)
-
-            # Update parent headers for children
-            new_parents = parent_headers.copy()
-            new_parents[f"h{level}"] = header
-
-            # Process children
-            child_sections = self._create_sections_from_outline(node["children"], new_parents)
-            sections.extend(child_sections)
-
-        return sections
-
-    def split_text(self, text: str) -> List[Section]:
+    def split_text(self, text: str) -> List[SectionRecord]:
         """Split Markdown text into sections while maintaining header hierarchy.
 
         Processes a Markdown document and splits it into sections based on
@@ -306,13 +290,13 @@ class MarkdownSplitter:
                        followed by a space (e.g., "# Header 1", "## Header 2").
 
         Returns:
-            List[Section]: A list of Section objects, each containing:
+            List[SectionRecord]: A list of SectionRecord objects, each containing:
                 - section_header (str): The header text without '#' markers
                 - section_text (str): The content between this header and the next
                 - header_level (int): The level of the header (1 for H1, 2 for H2, etc.)
-                - metadata (SectionMetadata): Contains:
+                - metadata (SectionMetadataRecord): Contains:
                     - parents (Dict[str, str]): Parent headers by level
-                    - siblings (List[str]): Other headers at same level with same parent
+                    - siblings (Tuple[str, ...]): Other headers at same level with same parent
 
         Example:
             >>> text = '''
@@ -329,23 +313,88 @@ class MarkdownSplitter:
             >>> sections[1].metadata.parents
             {'h1': 'Main Topic'}
             >>> sections[1].metadata.siblings
-            ['Sub Topic B']
+            ('Sub Topic B',)
         """
-        if not text.strip():
+        if not text or text.isspace():
             logger.warning("`split_text` received empty text input.")
             return []
+        if "#" not in text:
+            # Without a '#' there can be no headers, so skip the scan entirely
+            return []
 
-        # Get document outline
-        outline = self.get_document_outline(text)
-
-        # Create sections from outline
-        sections = self._create_sections_from_outline(outline)
+        sections = list(self.split_text_iter(text))
 
-        logger.info(f"Successfully split the Markdown into {len(sections)} sections.")
+        logger.debug("Successfully split the Markdown into %d sections.", len(sections))
         return sections
 
+    def split_text_iter(self, text: str) -> Iterator[SectionRecord]:
+        """Lazily split Markdown text into sections while maintaining header hierarchy.
+
+        Behaves like `split_text`, but yields each section as it is created instead of
+        building the full list. The headers are scanned up front into parallel arrays
+        (header text, level, offsets and the index of the immediate parent), since sibling
+        relationships depend on headers that appear later in the text. Section content,
+        parents and siblings are only materialized when a section is yielded.
+
+        Args:
+            text (str): The Markdown text to split.
+
+        Yields:
+            SectionRecord: Sections in document order.
+        """
+        if "#" not in text:
+            return
+
+        offsets = _scan(text)
+        count = len(offsets)
+        headers: List[str] = []
+        levels = array("B")
+        line_starts = array("L")
+        content_starts = array("L")
+        parent_indices = array("l")
+
+        # Single pass: the stack holds the indices of the currently open headers
+        stack: List[int] = []
+        sibling_groups: Dict[Tuple[int, int], List[str]] = {}
+        for i, (line_start, line_length, level, header) in enumerate(offsets):
+            while stack and levels[stack[-1]] >= level:
+                stack.pop()
+            parent = stack[-1] if stack else -1
+
+            headers.append(header)
+            levels.append(level)
+            line_starts.append(line_start)
+            content_starts.append(line_start + line_length + 1)
+            parent_indices.append(parent)
+            sibling_groups.setdefault((parent, level), []).append(header)
+            stack.append(i)
+
+        for i in range(count):
+            level = levels[i]
+            header = headers[i]
+            content_end = line_starts[i + 1] if i + 1 < count else len(text)
+
+            ancestors = []
+            parent = parent_indices[i]
+            while parent != -1:
+                ancestors.append(parent)
+                parent = parent_indices[parent]
+
+            siblings = sibling_groups[(parent_indices[i], level)]
+            yield SectionRecord(
+                section_header=header,
+                section_text=text[content_starts[i] : content_end].strip(),
+                header_level=level,
+                metadata=SectionMetadataRecord(
+                    parents={f"h{levels[j]}": headers[j] for j in reversed(ancestors)},
+                    siblings=tuple(h for h in siblings if h != header),
+                ),
+            )
+
     @classmethod
-    def from_file(cls, filepath: Union[str, Path], encoding: str = "utf-8") -> List[Section]:
+    def from_file(
+        cls, filepath: Union[str, Path], encoding: str = "utf-8"
+    ) -> List[SectionRecord]:
         """Create sections from a Markdown file."""
         path = Path(filepath)
         if not path.exists():
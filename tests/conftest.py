@@ -1,7 +1,7 @@
 import pytest
 from fastmcp import FastMCP
 
-from models import Section
+from models import SectionRecord
 from splitter import MarkdownSplitter
 
 
@@ -11,7 +11,7 @@ def mcp_server():
     server = FastMCP("TestServer")
 
     @server.tool
-    def split_text(text: str) -> list[Section]:
+    def split_text(text: str) -> list[SectionRecord]:
         """Splits Markdown text"""
         return MarkdownSplitter().split_text(text)
 
@@ -0,0 +1,201 @@
+import dataclasses
+import json
+
+import ormsgpack
+import pytest
+from fastapi.testclient import TestClient
+from fastmcp import Client
+
+import main
+from main import _serialize
+from main import _split_cached
+from main import _stream_json_array
+from main import app
+from main import mcp
+from models import Section
+from models import SectionMetadataRecord
+from models import SectionRecord
+
+MARKDOWN = """# Introduction
+Welcome to the guide.
+
+## Getting Started
+First steps here."""
+
+
+def test_serialize_pydantic_models():
+    """Test that Section models are serialized through orjson."""
+    section = Section(section_header="Intro", section_text="Text", header_level=1)
+
+    data = json.loads(_serialize([section]))
+
+    assert data == [section.model_dump()]
+
+
+def test_serialize_section_records():
+    """Test that SectionRecord objects serialize to the Section schema."""
+    record = SectionRecord(
+        section_header="Sub",
+        section_text="Text",
+        header_level=2,
+        metadata=SectionMetadataRecord(parents={"h1": "Intro"}, siblings=["Other"]),
+    )
+
+    data = json.loads(_serialize([record]))
+
+    assert data == [Section.model_validate(record, from_attributes=True).model_dump()]
+
+
+def test_serialize_unsupported_type():
+    """Test that unsupported types raise a TypeError."""
+    with pytest.raises(TypeError):
+        _serialize(object())
+
+
+def test_split_cached_reuses_results():
+    """Test that repeated documents are served from the cache."""
+    _split_cached.cache_clear()
+
+    first = _split_cached(MARKDOWN)
+    second = _split_cached(MARKDOWN)
+
+    assert first is second
+    assert _split_cached.cache_info().hits == 1
+    assert [s.section_header for s in first] == ["Introduction", "Getting Started"]
+
+
+def test_split_cached_results_are_frozen():
+    """Test that cached sections cannot be modified by one caller for the others."""
+    _split_cached.cache_clear()
+    section = _split_cached(MARKDOWN)[1]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        section.section_text = "changed"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        section.metadata.normalized = True
+    assert _split_cached(MARKDOWN)[1].section_text == "First steps here."
+
+
+def test_stream_json_array():
+    """Test that streamed chunks form a valid JSON array."""
+    assert b"".join(_stream_json_array([])) == b"[]"
+    items = [{"a": 1}, [2], "b"]
+    assert json.loads(b"".join(_stream_json_array(items))) == items
+
+
+def test_stream_json_array_batches_items():
+    """Test that items are buffered into a bounded number of chunks."""
+    items = [{"section_header": "Header", "section_text": "x" * 100}] * 5000
+    chunks = list(_stream_json_array(items))
+    assert len(chunks) < len(items) // 100
+    assert json.loads(b"".join(chunks)) == items
+
+
+@pytest.mark.parametrize("threshold", [len(MARKDOWN) + 1, 0])
+def test_split_endpoint(monkeypatch, threshold):
+    """Test the /split endpoint with both the buffered and the streaming response."""
+    monkeypatch.setattr(main, "STREAMING_THRESHOLD", threshold)
+    client = TestClient(app)
+
+    response = client.post("/split", json={"text": MARKDOWN})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    sections = response.json()
+    assert [s["section_header"] for s in sections] == ["Introduction", "Getting Started"]
+    assert sections[0]["metadata"]["siblings"] == []
+
+
+@pytest.mark.parametrize("threshold", [len(MARKDOWN) + 1, 0])
+def test_split_endpoint_msgpack(monkeypatch, threshold):
+    """Test that the /split endpoint returns MessagePack when requested."""
+    monkeypatch.setattr(main, "STREAMING_THRESHOLD", threshold)
+    client = TestClient(app)
+
+    response = client.post(
+        "/split", json={"text": MARKDOWN}, headers={"Accept": "application/msgpack"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    sections = ormsgpack.unpackb(response.content)
+    assert sections == client.post("/split", json={"text": MARKDOWN}).json()
+
+
+def test_split_endpoint_markdown_body():
+    """Test that raw Markdown bodies are accepted by the /split endpoint."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/split", content=MARKDOWN, headers={"Content-Type": "text/markdown"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == client.post("/split", json={"text": MARKDOWN}).json()
+
+
+@pytest.mark.parametrize("body", [b"not json", b"{}", b'{"text": 1}', b"[]"])
+def test_split_endpoint_invalid_body(body):
+    """Test that malformed JSON bodies are rejected with a validation error."""
+    client = TestClient(app)
+
+    response = client.post("/split", content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_server_split_text():
+    """Test the split_text tool registered on the application server."""
+    async with Client(mcp) as client:
+        result = await client.call_tool("split_text", {"text": MARKDOWN})
+
+        sections = json.loads(result[0].text)
+
+        assert [s["section_header"] for s in sections] == ["Introduction", "Getting Started"]
+        assert sections[1]["metadata"]["parents"] == {"h1": "Introduction"}
+
+
+@pytest.mark.asyncio
+async def test_server_split_text_skips_cache_for_large_documents(monkeypatch):
+    """Test that documents at or above the streaming threshold are not cached."""
+    monkeypatch.setattr(main, "STREAMING_THRESHOLD", len(MARKDOWN))
+    _split_cached.cache_clear()
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("split_text", {"text": MARKDOWN})
+
+        sections = json.loads(result[0].text)
+
+    assert [s["section_header"] for s in sections] == ["Introduction", "Getting Started"]
+    assert _split_cached.cache_info().currsize == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("text", ["", "   \n", "Plain prose without any headers."])
+async def test_server_split_text_without_headers(monkeypatch, text):
+    """Test that text without headers is answered without running the splitter."""
+
+    def fail(text):
+        raise AssertionError("the splitter should not run for text without headers")
+
+    monkeypatch.setattr(main, "_split_cached", fail)
+    async with Client(mcp) as client:
+        result = await client.call_tool("split_text", {"text": text})
+
+        assert json.loads(result[0].text) == []
+
+
+def test_split_endpoint_openapi():
+    """Test that the /split response schema is documented without a response model."""
+    route = next(route for route in app.routes if getattr(route, "path", None) == "/split")
+    schema = app.openapi()
+
+    content = schema["paths"]["/split"]["post"]["responses"]["200"]["content"]
+
+    assert route.response_field is None
+    assert content["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/Section"
+    }
+    assert "application/msgpack" in content
+    assert "Section" in schema["components"]["schemas"]
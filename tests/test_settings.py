@@ -0,0 +1,23 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+from settings import _start_queue_listeners
+
+
+def test_start_queue_listeners(monkeypatch):
+    """Test that queue handlers get a running listener that is stopped at exit."""
+    target = logging.handlers.MemoryHandler(capacity=10)
+    handler = logging.handlers.QueueHandler(queue.Queue())
+    handler.listener = logging.handlers.QueueListener(handler.queue, target)
+    exit_callbacks = []
+    monkeypatch.setattr(logging, "getHandlerByName", {"queue": handler}.get)
+    monkeypatch.setattr(atexit, "register", exit_callbacks.append)
+
+    _start_queue_listeners({"handlers": {"queue": {}, "console": {}}})
+    handler.emit(logging.makeLogRecord({"msg": "queued", "levelno": logging.INFO}))
+    for callback in exit_callbacks:
+        callback()
+
+    assert [record.getMessage() for record in target.buffer] == ["queued"]
@@ -35,6 +35,16 @@ print("hello")
 More content.
 """
 
+TILDE_FENCE_MARKDOWN = """# Real Header
+~~~bash
+# Install dependencies
+```
+## Still code
+~~~
+
+## Next Header
+Content"""
+
 SIBLINGS_MARKDOWN = """# Main
 Content
 
@@ -47,6 +57,25 @@ Second content
 ## Third
 Third content"""
 
+DUPLICATE_HEADERS_MARKDOWN = """# Guide
+## Setup
+Guide setup
+
+# Reference
+## Setup
+Reference setup
+
+## Usage
+Usage content"""
+
+HEADER_WHITESPACE_MARKDOWN = """#   Spaced Header  \t
+Spaced content
+
+##\tTabbed Header
+Tabbed content
+
+####### Not a header"""
+
 EMPTY_MARKDOWN = ""
 
 
@@ -124,6 +153,21 @@ async def test_split_text_code_blocks_ignored(mcp_server):
         assert "More content" in sections[0]["section_text"]
 
 
+@pytest.mark.asyncio
+async def test_split_text_code_block_content_preserved(mcp_server):
+    """Test that fenced code blocks are kept verbatim and only closed by a matching fence."""
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("split_text", {"text": TILDE_FENCE_MARKDOWN})
+
+        data = json.loads(result[0].text)
+        sections = data if isinstance(data, list) else [data]
+
+        assert [s["section_header"] for s in sections] == ["Real Header", "Next Header"]
+        assert sections[0]["section_text"] == (
+            "~~~bash\n# Install dependencies\n```\n## Still code\n~~~"
+        )
+
+
 @pytest.mark.asyncio
 async def test_split_text_siblings_detection(mcp_server):
     """Test sibling relationships are correctly identified."""
@@ -140,3 +184,36 @@ async def test_split_text_siblings_detection(mcp_server):
         assert "First" in siblings
         assert "Third" in siblings
         assert len(siblings) == 2
+
+
+@pytest.mark.asyncio
+async def test_split_text_duplicate_headers(mcp_server):
+    """Test that repeated header texts under different parents are all kept."""
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("split_text", {"text": DUPLICATE_HEADERS_MARKDOWN})
+
+        data = json.loads(result[0].text)
+        sections = data if isinstance(data, list) else [data]
+
+        setups = [s for s in sections if s["section_header"] == "Setup"]
+
+        assert len(sections) == 5
+        assert [s["section_text"] for s in setups] == ["Guide setup", "Reference setup"]
+        assert setups[0]["metadata"]["parents"] == {"h1": "Guide"}
+        assert setups[0]["metadata"]["siblings"] == []
+        assert setups[1]["metadata"]["parents"] == {"h1": "Reference"}
+        assert setups[1]["metadata"]["siblings"] == ["Usage"]
+
+
+@pytest.mark.asyncio
+async def test_split_text_header_markers_stripped(mcp_server):
+    """Test that header markers and surrounding whitespace are stripped while scanning."""
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("split_text", {"text": HEADER_WHITESPACE_MARKDOWN})
+
+        data = json.loads(result[0].text)
+        sections = data if isinstance(data, list) else [data]
+
+        assert [s["section_header"] for s in sections] == ["Spaced Header", "Tabbed Header"]
+        assert [s["header_level"] for s in sections] == [1, 2]
+        assert sections[1]["section_text"] == "Tabbed content\n\n####### Not a header"